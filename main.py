@@ -3,10 +3,9 @@ import math
 import colorsys
 from pathlib import Path
 from typing import Optional, Callable
-from enum import Enum
+from enum import Enum, IntEnum
 
 import wx
-import wx.lib.buttons
 import wx.lib.inspection
 
 from sweeper import Game, CellState, GameState
@@ -24,12 +23,37 @@ class SmileFace(Enum):
 	HAPPY = "happy"
 
 
+CELL_SIZE = 16
+
+
+class CellBitmap(IntEnum):
+	# indexes into the cell sprite sheet (410.bmp)
+	UNOPENED = 0
+	FLAGGED = 1
+	QUESTIONED = 2
+	MINE_RED = 3
+	MINE_X = 4
+	MINE = 5
+	QUESTIONED_PRESSED = 6
+	EMPTY = 15  # numbers count down from 8 at index 7, so a count of n is EMPTY - n
+
+
 COLOR_HIGHLIGHT: wx.Colour
 COLOR_NEUTRAL: wx.Colour
 COLOR_SHADOW: wx.Colour
 
 
-def make_bitmaps(source: wx.Image, size: tuple[int, int], count: int) -> list[wx.Bitmap]:
+# decoded sprite sheets, so the same asset is only ever loaded & split once
+_BITMAP_CACHE: dict[tuple[str, tuple[int, int], int], list[wx.Bitmap]] = {}
+
+
+def make_bitmaps(path: Path, size: tuple[int, int], count: int) -> list[wx.Bitmap]:
+	key = (str(path), size, count)
+	cached = _BITMAP_CACHE.get(key)
+	if cached is not None:
+		return cached
+
+	source = wx.Image(str(path))
 	bitmaps = []
 	for index in range(count):
 		rect = wx.Rect(
@@ -41,12 +65,29 @@ def make_bitmaps(source: wx.Image, size: tuple[int, int], count: int) -> list[wx
 		image: wx.Image = source.GetSubImage(rect)
 		if not image:
 			raise ValueError(f"{index=} out of bounds!!")
+		if not image.HasAlpha():
+			# opaque alpha, so drawing these into the 32-bit buffers below keeps them opaque
+			image.InitAlpha()
 		bitmaps.append(image.ConvertToBitmap())
+
+	_BITMAP_CACHE[key] = bitmaps
 	return bitmaps
 
 
-def draw_border(
-	dc: wx.DC,
+# pens are GDI resources, so make one per colour and reuse it
+_PEN_CACHE: dict[int, wx.Pen] = {}
+
+
+def _pen(colour: wx.Colour) -> wx.Pen:
+	key = colour.GetRGBA()
+	pen = _PEN_CACHE.get(key)
+	if pen is None:
+		pen = wx.Pen(colour)
+		_PEN_CACHE[key] = pen
+	return pen
+
+
+def build_border(
 	width: int,
 	top_left: wx.Position,
 	bottom_right: wx.Position,
@@ -57,11 +98,11 @@ def draw_border(
 	right: wx.Colour,
 
 	inset: bool = False
-):
-	pen_top = wx.Pen(top)
-	pen_bottom = wx.Pen(bottom)
-	pen_left = wx.Pen(left)
-	pen_right = wx.Pen(right)
+) -> tuple[list[tuple[int, int, int, int]], list[wx.Pen]]:
+	pen_top = _pen(top)
+	pen_bottom = _pen(bottom)
+	pen_left = _pen(left)
+	pen_right = _pen(right)
 
 	root_top_left = top_left
 	root_bottom_right = bottom_right - (1, 1)
@@ -94,10 +135,7 @@ def draw_border(
 			pen_left
 		))
 
-	dc.DrawLineList(
-		lines=lines,
-		pens=pens
-	)
+	return lines, pens
 
 
 class LCD(wx.Panel):
@@ -116,22 +154,56 @@ class LCD(wx.Panel):
 
 		self._bitmap_size = (13, 23)
 		self._bitmaps = make_bitmaps(
-			source=wx.Image(str(ASSETS_PATH / "420.bmp")),
+			path=ASSETS_PATH / "420.bmp",
 			size=self._bitmap_size,
 			count=12
 		)
 
+		(
+			self._bmp_minus,
+			self._bmp_space,
+			*self._bmp_digits
+		) = self._bitmaps
+		self._bmp_digits.reverse()
+
+		# the minus sign takes up a digit
+		self._max_value = pow(10, self.digits) - 1
+		self._min_value = -(pow(10, self.digits - 1) - 1)
+
 		self.SetMinSize((
 			self._bitmap_size[0] * self.digits,
 			self._bitmap_size[1]
 		))
 
-		self._char_bitmaps = self._get_bitmaps()
+		self._char_bitmaps: list[wx.Bitmap] = [self._bmp_space] * self.digits
+
+		# all the digits get composed into this when the value changes, so painting is one draw
+		self._strip = wx.Bitmap.FromRGBA(
+			self._bitmap_size[0] * self.digits, self._bitmap_size[1],
+			alpha=wx.ALPHA_OPAQUE
+		)
+
+		self._update_char_bitmaps()
+		self._update_strip()
 
 		self.Bind(wx.EVT_PAINT, self._on_paint)
 
 	def _on_paint(self, _):
 		dc = wx.PaintDC(self)
+		dc.DrawBitmap(self._strip, 0, 0, False)
+
+	def set_value(self, value: int):
+		if value == self._value:
+			# already showing it
+			return
+
+		self._value = value
+		self._update_char_bitmaps()
+		self._update_strip()
+		self.Refresh()
+
+	def _update_strip(self):
+		dc = wx.MemoryDC(self._strip)
 		for (index, bitmap) in enumerate(self._char_bitmaps):
 			dc.DrawBitmap(
 				bmp=bitmap,
@@ -140,40 +212,32 @@ class LCD(wx.Panel):
 					0
 				)
 			)
+		dc.SelectObject(wx.NullBitmap)
 
-	def set_value(self, value: int):
-		self._value = value
-		self._char_bitmaps = self._get_bitmaps()
-		self.Refresh()
-
-	def _get_bitmaps(self):
-		(
-			bmp_minus,
-			bmp_space,
-			*bmp_digits
-		) = self._bitmaps
-
-		bmp_digits.reverse()
-
+	def _update_char_bitmaps(self):
 		value = self._value
-		value = min(value, pow(10, self.digits) - 1)
-		value = max(value, -(pow(10, self.digits - 1) - 1))
+		value = min(value, self._max_value)
+		value = max(value, self._min_value)
 
-		if self.pad_zeros:
-			format_string = "{:0" + str(self.digits) + "}"
-		else:
-			format_string = "{:" + str(self.digits) + "}"
+		negative = value < 0
+		value = -value if negative else value
 
-		str_value = format_string.format(value)
-		if len(str_value) != self.digits:
-			raise ValueError("failed to digit format")
+		out = self._char_bitmaps
+		fill = self._bmp_digits[0] if self.pad_zeros else self._bmp_space
+		for index in range(self.digits):
+			out[index] = fill
 
-		return [
-			bmp_minus if char == "-" else
-			bmp_space if char == " " else
-			bmp_digits[int(char)]
-			for char in str_value
-		]
+		index = self.digits - 1
+		while True:
+			value, digit = divmod(value, 10)
+			out[index] = self._bmp_digits[digit]
+			index -= 1
+			if value == 0:
+				break
+
+		if negative:
+			# padded zeros go after the minus sign, otherwise it sits right before the number
+			out[0 if self.pad_zeros else index] = self._bmp_minus
 
 
 class Scoreboard(wx.Panel):
@@ -187,7 +251,7 @@ class Scoreboard(wx.Panel):
 		self.sizer = wx.BoxSizer(wx.HORIZONTAL)
 
 		self._smile_bitmaps = make_bitmaps(
-			source=wx.Image(str(ASSETS_PATH / "430.bmp")),
+			path=ASSETS_PATH / "430.bmp",
 			size=(24, 24),
 			count=5
 		)
@@ -201,16 +265,11 @@ class Scoreboard(wx.Panel):
 
 		self.sizer.AddStretchSpacer()
 
-		self._smile_button = wx.lib.buttons.GenBitmapButton(
-			parent=self,
-			size=(24, 24),
-			bitmap=self._smile_bitmaps[4],
-			style=wx.BORDER_NONE
-		)
-		self._smile_button.Bind(wx.EVT_BUTTON, lambda _: on_smile_click())
-		self._smile_button.labelDelta = 0
-		self._smile_button.SetBitmapSelected(self._smile_bitmaps[0])
-		self.sizer.Add(self._smile_button, flag=wx.ALIGN_CENTER_VERTICAL | wx.TOP, border=1)
+		# the smile is drawn in _on_paint, the sizer just reserves its spot
+		self._smile_item: wx.SizerItem = self.sizer.Add(24, 24, flag=wx.ALIGN_CENTER_VERTICAL | wx.TOP, border=1)
+		self._smile_index = 4
+		self._smile_pressed = False
+		self._on_smile_click = on_smile_click
 
 		self.sizer.AddStretchSpacer()
 
@@ -223,57 +282,115 @@ class Scoreboard(wx.Panel):
 
 		self.SetSizer(self.sizer)
 
+		# lines & pens of all the borders, built on the first paint after a layout
+		self._border_lines: Optional[tuple[list, list]] = None
+
 		self.Bind(wx.EVT_PAINT, self._on_paint)
+		self.Bind(wx.EVT_SIZE, self._on_size)
+		self.Bind(wx.EVT_LEFT_DOWN, self._on_left_down)
+		self.Bind(wx.EVT_LEFT_DCLICK, self._on_left_down)
+		self.Bind(wx.EVT_LEFT_UP, self._on_left_up)
+		self.Bind(wx.EVT_MOTION, self._on_motion)
+		self.Bind(wx.EVT_MOUSE_CAPTURE_LOST, lambda _: self._set_smile_pressed(False))
 
 	def set_smile_face(self, face: SmileFace):
-		self._smile_button.SetBitmapLabel(self._smile_bitmaps[
+		smile_index = (
 			1 if face == SmileFace.COOL else
 			2 if face == SmileFace.SAD else
 			3 if face == SmileFace.SURPRISED else
 			4 if face == SmileFace.HAPPY else
 			0
-		])
-		self._smile_button.Refresh()
+		)
+		if smile_index == self._smile_index:
+			return
 
-	def _on_paint(self, _):
-		dc = wx.PaintDC(self)
+		self._smile_index = smile_index
+		self.RefreshRect(self._smile_item.GetRect())
 
-		draw_border(
-			dc=dc, width=1,
+	def _set_smile_pressed(self, pressed: bool):
+		if pressed == self._smile_pressed:
+			return
 
-			top_left=self._flags_lcd.GetPosition(),
-			bottom_right=self._flags_lcd.GetPosition() + self._flags_lcd.GetSize(),
+		self._smile_pressed = pressed
+		self.RefreshRect(self._smile_item.GetRect())
 
-			top=COLOR_SHADOW, left=COLOR_SHADOW,
-			right=COLOR_HIGHLIGHT, bottom=COLOR_HIGHLIGHT
-		)
+	def _on_left_down(self, event: wx.MouseEvent):
+		if self._smile_item.GetRect().Contains(event.GetPosition()):
+			if not self.HasCapture():
+				self.CaptureMouse()
+			self._set_smile_pressed(True)
 
-		draw_border(
-			dc=dc, width=1,
+	def _on_motion(self, event: wx.MouseEvent):
+		# while held, the smile only looks pressed when the mouse is over it, like a button
+		if self.HasCapture():
+			self._set_smile_pressed(self._smile_item.GetRect().Contains(event.GetPosition()))
 
-			top_left=self._smile_button.GetPosition(),
-			bottom_right=self._smile_button.GetPosition() + self._smile_button.GetSize(),
+	def _on_left_up(self, event: wx.MouseEvent):
+		if not self.HasCapture():
+			return
+		self.ReleaseMouse()
 
-			top=COLOR_SHADOW, left=COLOR_SHADOW, right=COLOR_SHADOW, bottom=COLOR_SHADOW
-		)
+		self._set_smile_pressed(False)
+		if self._smile_item.GetRect().Contains(event.GetPosition()):
+			self._on_smile_click()
+
+	def _on_size(self, event: wx.SizeEvent):
+		self._border_lines = None
+		event.Skip()  # still let the sizer lay us out
+
+	def _build_borders(self):
+		smile_rect = self._smile_item.GetRect()
 
-		draw_border(
-			dc=dc, width=1,
+		return [
+			build_border(
+				width=1,
+
+				top_left=self._flags_lcd.GetPosition(),
+				bottom_right=self._flags_lcd.GetPosition() + self._flags_lcd.GetSize(),
+
+				top=COLOR_SHADOW, left=COLOR_SHADOW,
+				right=COLOR_HIGHLIGHT, bottom=COLOR_HIGHLIGHT
+			),
+			build_border(
+				width=1,
+
+				top_left=smile_rect.GetTopLeft(),
+				bottom_right=smile_rect.GetTopLeft() + smile_rect.GetSize(),
 
-			top_left=self._time_lcd.GetPosition(),
-			bottom_right=self._time_lcd.GetPosition() + self._time_lcd.GetSize(),
+				top=COLOR_SHADOW, left=COLOR_SHADOW, right=COLOR_SHADOW, bottom=COLOR_SHADOW
+			),
+			build_border(
+				width=1,
+
+				top_left=self._time_lcd.GetPosition(),
+				bottom_right=self._time_lcd.GetPosition() + self._time_lcd.GetSize(),
+
+				top=COLOR_SHADOW, left=COLOR_SHADOW,
+				right=COLOR_HIGHLIGHT, bottom=COLOR_HIGHLIGHT
+			)
+		]
 
-			top=COLOR_SHADOW, left=COLOR_SHADOW,
-			right=COLOR_HIGHLIGHT, bottom=COLOR_HIGHLIGHT
+	def _on_paint(self, _):
+		dc = wx.PaintDC(self)
+		if self._border_lines is None:
+			lines = []
+			pens = []
+			for (border_lines, border_pens) in self._build_borders():
+				lines.extend(border_lines)
+				pens.extend(border_pens)
+			self._border_lines = (lines, pens)
+		dc.DrawLineList(*self._border_lines)
+
+		dc.DrawBitmap(
+			bmp=self._smile_bitmaps[0 if self._smile_pressed else self._smile_index],
+			pt=self._smile_item.GetRect().GetTopLeft()
 		)
 
 	def set_flags_value(self, value: int):
 		self._flags_lcd.set_value(value)
-		self._flags_lcd.Refresh()
 
 	def set_time_value(self, value: int):
 		self._time_lcd.set_value(value)
-		self._time_lcd.Refresh()
 
 
 class Minefield(wx.Panel):
@@ -286,164 +403,187 @@ class Minefield(wx.Panel):
 		super().__init__(
 			parent=parent
 		)
+		self.SetBackgroundStyle(wx.BG_STYLE_PAINT)  # every pixel gets drawn in _on_paint, no need to erase
 
 		self.cell_bitmaps = make_bitmaps(
-			source=wx.Image(str(ASSETS_PATH / "410.bmp")),
-			size=(16, 16),
+			path=ASSETS_PATH / "410.bmp",
+			size=(CELL_SIZE, CELL_SIZE),
 			count=16
 		)
 
-		self.button_grid: list[list[wx.lib.buttons.GenBitmapButton]] = []
-		self.sizer: Optional[wx.GridSizer] = None
 		self.size: Optional[tuple[int, int]] = None
 
+		# which of cell_bitmaps each cell shows in the backing bitmap, indexed [x][y]
+		self._cell_bmp_index: list[list[int]] = []
+		self._backing: Optional[wx.Bitmap] = None
+		self._game_over = False
+		self._pressed_point: Optional[tuple[int, int]] = None
+
 		self._last_game: Optional[Game] = None
 
 		self._on_click = on_click
 		self._on_right_click = on_right_click
 
-	def initialize_board(self, size: tuple[int, int]):
-		# if self.size == size:
-		# 	print("ignoring init-board call because size is the same")
-		# 	return
+		self.Bind(wx.EVT_PAINT, self._on_paint)
+		self.Bind(wx.EVT_LEFT_DOWN, self._on_left_down)
+		self.Bind(wx.EVT_LEFT_DCLICK, self._on_left_down)  # the second press of a fast double click only comes as a DCLICK
+		self.Bind(wx.EVT_LEFT_UP, self._on_left_up)
+		self.Bind(wx.EVT_MOTION, self._on_motion)
+		self.Bind(wx.EVT_RIGHT_DOWN, self._on_right_down)
+		self.Bind(wx.EVT_MOUSE_CAPTURE_LOST, lambda _: self._set_pressed_point(None))
 
+	def initialize_board(self, size: tuple[int, int]):
 		self.size = size
 
 		width, height = size
 
-		if self.sizer:
-			self.sizer.Clear(delete_windows=True)
-			# self.sizer.Destroy()
-			del self.sizer
-
-		button_grid = []
-
-		(
-			bmp_unopened,
-			bmp_flagged,
-			bmp_questioned,
-			bmp_mine_red,
-			bmp_mine_x,
-			bmp_mine,
-			bmp_questioned_pressed,
-			bmp_8,
-			bmp_7,
-			bmp_6,
-			bmp_5,
-			bmp_4,
-			bmp_3,
-			bmp_2,
-			bmp_1,
-			bmp_0
-		) = self.cell_bitmaps
-
-		sizer = wx.GridSizer(width, height, 0, 0)
-		self.SetSizer(sizer, deleteOld=True)
-
-		def make_button(point: tuple[int, int]):
-			button = wx.lib.buttons.GenBitmapButton(
-				parent=self,
-				size=(16, 16),
-				style=wx.BORDER_NONE,
-				bitmap=bmp_unopened
-			)
-			button.SetMinSize((16, 16))
-			button.Bind(wx.EVT_BUTTON, lambda _: self._on_click(point))
-			button.Bind(wx.EVT_RIGHT_DOWN, lambda _: self._on_right_click(point))
-			button.labelDelta = 0  # dont move when down
-			button.SetBitmapSelected(bmp_0)
-			return button
+		self._cell_bmp_index = [
+			[CellBitmap.UNOPENED] * height for _ in range(width)
+		]
+		self._pressed_point = None
 
+		# made as a 32-bit RGBA bitmap (a DIB on windows) so drawing it doesn't convert from a DDB every time
+		self._backing = wx.Bitmap.FromRGBA(
+			CELL_SIZE * width, CELL_SIZE * height,
+			alpha=wx.ALPHA_OPAQUE
+		)
+		dc = wx.MemoryDC(self._backing)
 		for x in range(width):
-			col = []
 			for y in range(height):
-				button = make_button((x, y))
-				col.append(button)
+				self._draw_cell(dc, (x, y))
+		dc.SelectObject(wx.NullBitmap)
+
+		# fixed-size grid, so size ourselves directly instead of waiting on a sizer pass
+		self.SetMinSize((CELL_SIZE * width, CELL_SIZE * height))
+		self.SetClientSize((CELL_SIZE * width, CELL_SIZE * height))
+		self.Refresh(eraseBackground=False)
+
+	def _get_cell_rect(self, point: tuple[int, int]) -> wx.Rect:
+		return wx.Rect(point[0] * CELL_SIZE, point[1] * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+
+	def _draw_cell(self, dc: wx.DC, point: tuple[int, int]):
+		dc.DrawBitmap(
+			self.cell_bitmaps[self._cell_bmp_index[point[0]][point[1]]],
+			point[0] * CELL_SIZE, point[1] * CELL_SIZE,
+			False
+		)
 
-			button_grid.append(col)
+	def _point_at(self, position: wx.Point) -> Optional[tuple[int, int]]:
+		if not self.size:
+			return None
 
-		for y in range(height):
-			for x in range(width):
-				sizer.Add(button_grid[x][y])
+		point = (position[0] // CELL_SIZE, position[1] // CELL_SIZE)
+		if not ((0 <= point[0] < self.size[0]) and (0 <= point[1] < self.size[1])):
+			return None
+		return point
 
-		self.button_grid = button_grid
-		self.sizer = sizer
-		print("DONE!!")
-		self.Layout()
-		self.Fit()
-		self.Refresh()
-		print("DONE AND FIT!!!")
+	def _set_pressed_point(self, point: Optional[tuple[int, int]]):
+		if point == self._pressed_point:
+			return
+
+		for changed_point in (self._pressed_point, point):
+			if changed_point:
+				self.RefreshRect(self._get_cell_rect(changed_point), eraseBackground=False)
+		self._pressed_point = point
+
+	def _on_left_down(self, event: wx.MouseEvent):
+		if not self.HasCapture():
+			self.CaptureMouse()
+		self._set_pressed_point(self._point_at(event.GetPosition()))
+
+	def _on_motion(self, event: wx.MouseEvent):
+		# like the real thing, the pressed cell follows the mouse while the button is held
+		if self.HasCapture():
+			self._set_pressed_point(self._point_at(event.GetPosition()))
+
+	def _on_left_up(self, event: wx.MouseEvent):
+		if not self.HasCapture():
+			# the press didn't start on us
+			return
+		self.ReleaseMouse()
+
+		point = self._point_at(event.GetPosition())
+		self._set_pressed_point(None)
+		if point:
+			self._on_click(point)
+
+	def _on_right_down(self, event: wx.MouseEvent):
+		point = self._point_at(event.GetPosition())
+		if point:
+			self._on_right_click(point)
+
+	def _get_cell_bmp_index(self, game: Game, point: tuple[int, int]) -> int:
+		if game.is_opened(point):
+			return CellBitmap.EMPTY - game.proximity_count(point)
+		elif game.is_flagged(point):
+			if self._game_over and not game.is_mine(point):
+				# if game is over and this flag was WRONG, show the X mine logo
+				return CellBitmap.MINE_X
+			return CellBitmap.FLAGGED
+		elif game.is_questioned(point):
+			return CellBitmap.QUESTIONED
+		elif self._game_over and game.is_mine(point):
+			if game.last_click == point:
+				return CellBitmap.MINE_RED
+			return CellBitmap.MINE
+		return CellBitmap.UNOPENED
+
+	def _get_pressed_bmp_index(self, index: int) -> int:
+		if index == CellBitmap.QUESTIONED:
+			return CellBitmap.QUESTIONED_PRESSED
+		if index == CellBitmap.UNOPENED and not self._game_over:
+			return CellBitmap.EMPTY
+		return index
 
 	def update(self, game: Game):
 		print(f"minefield update called w {game}")
 		if not game:
 			raise ValueError("no game!!!")
 
+		# the game keeps track of which cells it changed, so only those need looking at
+		points = game.pop_dirty_points()
 		if self._last_game != game:
 			print("new game, re-initializing...")
 			self._last_game = game
 			self.initialize_board(game.size)
+			points = [(x, y) for x in range(self.size[0]) for y in range(self.size[1])]
 
-		# if game.state == GameState.idle:
-		# 	return
+		self._game_over = game.state == GameState.lost
 
-		(
-			bmp_unopened,
-			bmp_flagged,
-			bmp_questioned,
-			bmp_mine_red,
-			bmp_mine_x,
-			bmp_mine,
-			bmp_questioned_pressed,
-			*number_bmps
-		) = self.cell_bitmaps
-
-		bmp_empty = number_bmps[-1]
-
-		width = len(self.button_grid)
-		height = len(self.button_grid[0])
-
-		game_over = game.state == GameState.lost
-		for x in range(width):
-			for y in range(height):
-				point = (x, y)
-				button = self.button_grid[x][y]
-				opened = game.is_opened(point)
-				flagged = game.is_flagged(point)
-				questioned = game.is_questioned(point)
-				# print(f"Updated... {point=} {state=}")
-
-				if opened:
-					count = game.proximity_count(point)
-					count_img = number_bmps[-count - 1]
-					button.SetBitmapLabel(count_img)
-					button.SetBitmapSelected(count_img)
-				elif flagged:
-					if game_over and not game.is_mine(point):
-						# if game is over and this flag was WRONG, show the X mine logo
-						button.SetBitmapLabel(bmp_mine_x)
-						button.SetBitmapSelected(bmp_mine_x)
-					else:
-						button.SetBitmapLabel(bmp_flagged)
-						button.SetBitmapSelected(bmp_flagged)
-				elif questioned:
-					button.SetBitmapLabel(bmp_questioned)
-					button.SetBitmapSelected(bmp_questioned_pressed)
-				elif game_over and game.is_mine(point):
-					if game.last_click == point:
-						button.SetBitmapLabel(bmp_mine_red)
-						button.SetBitmapSelected(bmp_mine_red)
-					else:
-						button.SetBitmapLabel(bmp_mine)
-						button.SetBitmapSelected(bmp_mine)
-				else:
-					button.SetBitmapLabel(bmp_unopened)
-					if game_over:
-						button.SetBitmapSelected(bmp_unopened)
-					else:
-						button.SetBitmapSelected(bmp_empty)
+		# only the cells whose bitmap actually changed get redrawn into the backing bitmap
+		dirty = []
+		for point in points:
+			index = self._get_cell_bmp_index(game, point)
+			if self._cell_bmp_index[point[0]][point[1]] != index:
+				self._cell_bmp_index[point[0]][point[1]] = index
+				dirty.append(point)
 
-		self.Refresh()
+		if not dirty:
+			return
+
+		dc = wx.MemoryDC(self._backing)
+		region = wx.Region()
+		for point in dirty:
+			self._draw_cell(dc, point)
+			region.Union(self._get_cell_rect(point))
+		dc.SelectObject(wx.NullBitmap)
+
+		self.RefreshRect(region.GetBox(), eraseBackground=False)
+
+	def _on_paint(self, _):
+		dc = wx.BufferedPaintDC(self)
+		if not self._backing:
+			return
+
+		dc.DrawBitmap(self._backing, 0, 0, False)
+
+		if self._pressed_point:
+			(x, y) = self._pressed_point
+			dc.DrawBitmap(
+				self.cell_bitmaps[self._get_pressed_bmp_index(self._cell_bmp_index[x][y])],
+				x * CELL_SIZE, y * CELL_SIZE,
+				False
+			)
 
 
 class GameFrame(wx.Frame):
@@ -456,7 +596,6 @@ class GameFrame(wx.Frame):
 		)
 
 		self.SetBackgroundColour(COLOR_NEUTRAL)
-		self.button_grid: list[list[wx.lib.buttons.GenBitmapButton]] = []
 
 		self.outer_sizer = wx.BoxSizer(wx.VERTICAL)
 		self.sizer = wx.BoxSizer(wx.VERTICAL)
@@ -482,7 +621,11 @@ class GameFrame(wx.Frame):
 		self.init_new_game()
 		self.update()
 
+		# the background & borders never change between resizes, so they're painted once into this
+		self._chrome_bmp: Optional[wx.Bitmap] = None
+
 		self.Bind(wx.EVT_PAINT, self.on_paint)
+		self.Bind(wx.EVT_SIZE, self.on_size)
 		self.Fit()
 
 		self.game_stopwatch = wx.StopWatch()
@@ -510,7 +653,7 @@ class GameFrame(wx.Frame):
 		elif self.game.state in {GameState.playing, GameState.idle}:
 			self.scoreboard.set_smile_face(SmileFace.HAPPY)
 
-		self.scoreboard.set_flags_value(self.game.mine_count - len(self.game.flagged_points))
+		self.scoreboard.set_flags_value(self.game.mine_count - self.game.get_flagged_count())
 
 	def on_smile_click(self):
 		print("smile clicked")
@@ -520,42 +663,67 @@ class GameFrame(wx.Frame):
 			self.init_new_game()
 			self.update()
 
-	def on_paint(self, event: wx.PaintEvent):
-		dc = wx.PaintDC(self)
+	def on_size(self, event: wx.SizeEvent):
+		self._chrome_bmp = None
+		self.Refresh()
+		event.Skip()  # still let the sizer lay us out
 
+	def _build_borders(self):
 		background_colour = self.GetBackgroundColour()
 
-		draw_border(
-			dc=dc,
-			width=3,
-			inset=True,
+		return [
+			build_border(
+				width=3,
+				inset=True,
 
-			top_left=wx.Position(0, 0),
-			bottom_right=self.GetClientSize(),
+				top_left=wx.Position(0, 0),
+				bottom_right=self.GetClientSize(),
 
-			top=COLOR_HIGHLIGHT, left=COLOR_HIGHLIGHT,
-			right=background_colour, bottom=background_colour
-		)
+				top=COLOR_HIGHLIGHT, left=COLOR_HIGHLIGHT,
+				right=background_colour, bottom=background_colour
+			),
 
-		draw_border(
-			dc=dc,
-			width=2,
-			top_left=self.scoreboard.GetPosition(),
-			bottom_right=self.scoreboard.GetPosition() + self.scoreboard.GetSize(),
+			build_border(
+				width=2,
+				top_left=self.scoreboard.GetPosition(),
+				bottom_right=self.scoreboard.GetPosition() + self.scoreboard.GetSize(),
 
-			top=COLOR_SHADOW, left=COLOR_SHADOW,
-			right=COLOR_HIGHLIGHT, bottom=COLOR_HIGHLIGHT
-		)
+				top=COLOR_SHADOW, left=COLOR_SHADOW,
+				right=COLOR_HIGHLIGHT, bottom=COLOR_HIGHLIGHT
+			),
 
-		draw_border(
-			dc=dc,
-			width=3,
-			top_left=self.minefield.GetPosition(),
-			bottom_right=self.minefield.GetPosition() + self.minefield.GetSize(),
+			build_border(
+				width=3,
+				top_left=self.minefield.GetPosition(),
+				bottom_right=self.minefield.GetPosition() + self.minefield.GetSize(),
 
-			top=COLOR_SHADOW, left=COLOR_SHADOW,
-			right=COLOR_HIGHLIGHT, bottom=COLOR_HIGHLIGHT
-		)
+				top=COLOR_SHADOW, left=COLOR_SHADOW,
+				right=COLOR_HIGHLIGHT, bottom=COLOR_HIGHLIGHT
+			)
+		]
+
+	def _build_chrome(self) -> Optional[wx.Bitmap]:
+		(width, height) = self.GetClientSize()
+		if width <= 0 or height <= 0:
+			return None
+
+		bitmap = wx.Bitmap(width, height)
+		dc = wx.MemoryDC(bitmap)
+		dc.SetBackground(wx.Brush(self.GetBackgroundColour()))
+		dc.Clear()
+		for (lines, pens) in self._build_borders():
+			dc.DrawLineList(lines, pens)
+		dc.SelectObject(wx.NullBitmap)
+		return bitmap
+
+	def on_paint(self, event: wx.PaintEvent):
+		dc = wx.PaintDC(self)
+
+		if self._chrome_bmp is None:
+			# built lazily so the layout is done by the time we measure everything
+			self._chrome_bmp = self._build_chrome()
+		if self._chrome_bmp is not None:
+			dc.DrawBitmap(self._chrome_bmp, 0, 0, False)
 
 	def init_new_game(self):
 		self.game = Game(
@@ -604,16 +772,30 @@ class GameFrame(wx.Frame):
 		self.update()
 
 
+def _load_theme(path: Path) -> tuple[wx.Colour, wx.Colour, wx.Colour]:
+	# returns the (highlight, neutral, shadow) colours of the theme at path
+	with open(path / "colors.json", "r") as file:
+		colors_data = json.load(file)
+
+	def parse_color(color: str) -> wx.Colour:
+		colour = wx.Colour(color)
+		if not colour.IsOk():
+			raise ValueError(f"invalid colour {color!r} in {path / 'colors.json'}")
+		return colour
+
+	return (
+		parse_color(colors_data["highlight"]),
+		parse_color(colors_data["neutral"]),
+		parse_color(colors_data["shadow"])
+	)
+
+
 def main():
 	global COLOR_HIGHLIGHT, COLOR_NEUTRAL, COLOR_SHADOW
 	
 	app = wx.App()
 	# whatever. bad code.
-	with open(ASSETS_PATH / "colors.json", "r") as file:
-		colors_data = json.load(file)
-		COLOR_HIGHLIGHT = wx.Colour(colors_data["highlight"])
-		COLOR_NEUTRAL = wx.Colour(colors_data["neutral"])
-		COLOR_SHADOW = wx.Colour(colors_data["shadow"])
+	(COLOR_HIGHLIGHT, COLOR_NEUTRAL, COLOR_SHADOW) = _load_theme(ASSETS_PATH)
 
 	frame = GameFrame()
 	frame.Show()
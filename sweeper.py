@@ -1,10 +1,14 @@
 import random
+from array import array
 from enum import Enum
 from typing import Union, Optional
 
 
 DEBUG_BOARD = False  # enable a constant, non-randomized debug board
 
+# offsets to all 8 neighbors of a cell
+_NEIGHBORS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
 
 class GameState(Enum):
 	idle = "idle"
@@ -31,14 +35,20 @@ class Game:
 		self.mine_count = mine_count
 		self.state: GameState = GameState.idle
 
-		self.mine_points = set()
-		self.questioned_points = set()
-		self.flagged_points = set()
+		# per-cell grids are flat and indexed by y * width + x
+		self._w = self.size[0]
+		self._opened = bytearray(self.size[0] * self.size[1])
+		self._opened_count = 0
+		self._proximity = array("b", bytes(self.size[0] * self.size[1]))  # counts are -1 to 8, fits in a signed byte
+
+		# one bit per cell, at the same index as the flat grids. (python ints are big enough for any board)
+		self.mine_bits = 0
+		self.questioned_bits = 0
+		self.flagged_bits = 0
 		self.last_click: Optional[tuple[int, int]] = None
 
-		self._cell_opened_grid: list[list[bool]] = [
-			([False] * self.size[0]) for _ in range(self.size[1])
-		]
+		# points whose displayed state changed since the last pop_dirty_points() call
+		self._dirty_points: set[tuple[int, int]] = set()
 
 	def is_won(self):
 		if self.state == GameState.won:
@@ -47,39 +57,48 @@ class Game:
 		if self.state == GameState.lost:
 			return False
 
-		non_mine_points = set([
-			(x, y) for x in range(self.size[0]) for y in range(self.size[1])
-		]) - self.mine_points
-
-		for point in non_mine_points:
-			# every non-mine point must be opened
-			if not self.is_opened(point):
-				return False
+		# every non-mine point must be opened
+		if self._opened_count != (self.size[0] * self.size[1]) - self.mine_bits.bit_count():
+			return False
 
 		self.state = GameState.won
 		return True
 
-	def _flag_all_mines(self):
-		for point in self.mine_points:
-			self.flag(point)
+	def pop_dirty_points(self) -> set[tuple[int, int]]:
+		dirty_points = self._dirty_points
+		self._dirty_points = set()
+		return dirty_points
 
-	def generate_board(self, disallowed_points: list[tuple[int, int]] = None):
-		possible_points = list(
-			(x, y) for x in range(self.size[0]) for y in range(self.size[1]) if (disallowed_points is None) or ((x, y) not in disallowed_points)
+	def _mark_all_dirty(self):
+		self._dirty_points.update(
+			(x, y) for x in range(self.size[0]) for y in range(self.size[1])
 		)
-		self.mine_points = set()
 
-		for _ in range(self.mine_count):
-			point_index = self.random.randint(0, len(possible_points) - 1)
-			point = possible_points[point_index]
-			possible_points.pop(point_index)
-			self.mine_points.add(point)
+	def _bit(self, point: tuple[int, int]) -> int:
+		return 1 << (point[1] * self._w + point[0])
+
+	def _points_from_bits(self, bits: int) -> list[tuple[int, int]]:
+		points = []
+		while bits:
+			lowest_bit = bits & -bits
+			index = lowest_bit.bit_length() - 1
+			points.append((index % self._w, index // self._w))
+			bits ^= lowest_bit
+		return points
+
+	def _flag_all_mines(self):
+		for point in self.get_mine_points():
+			self.flag(point)
 
-		assert (len(possible_points) + len(self.mine_points)) == (self.size[0] * self.size[1]) - (len(disallowed_points) if disallowed_points else 0)
-		del possible_points
+	def generate_board(self, disallowed_points: list[tuple[int, int]] = None):
+		disallowed = set(disallowed_points) if disallowed_points else frozenset()
+		possible_points = [
+			(x, y) for x in range(self.size[0]) for y in range(self.size[1]) if (x, y) not in disallowed
+		]
+		mine_points = self.random.sample(possible_points, self.mine_count)
 
 		if DEBUG_BOARD:
-			self.mine_points = {
+			mine_points = {
 				(0, 3),
 				(2, 3),
 				(6, 4),
@@ -92,59 +111,92 @@ class Game:
 				(3, 7),
 				(2, 8)
 			}
+
+		self.mine_bits = 0
+		for point in mine_points:
+			self.mine_bits |= self._bit(point)
+
+		self._build_proximity()
 		self.state = GameState.playing
 		self.last_click = None
 
+	def _build_proximity(self):
+		# count every cell's neighboring mines once, instead of on every proximity_count call
+		proximity = array("b", bytes(self.size[0] * self.size[1]))
+		width = self._w
+
+		mine_points = self.get_mine_points()
+		for (mine_x, mine_y) in mine_points:
+			for (x_off, y_off) in _NEIGHBORS:
+				x = mine_x + x_off
+				y = mine_y + y_off
+				if self.in_range((x, y)):
+					proximity[y * width + x] += 1
+
+		for (mine_x, mine_y) in mine_points:
+			proximity[mine_y * width + mine_x] = -1
+
+		self._proximity = proximity
+
 	def is_flagged(self, point: tuple[int, int]) -> bool:
-		return point in self.flagged_points
+		return bool(self.flagged_bits & self._bit(point))
 
 	def get_flagged_points(self) -> list[tuple[int, int]]:
-		return list(self.flagged_points)
+		return self._points_from_bits(self.flagged_bits)
+
+	def get_flagged_count(self) -> int:
+		return self.flagged_bits.bit_count()
+
+	def get_mine_points(self) -> list[tuple[int, int]]:
+		return self._points_from_bits(self.mine_bits)
 
 	def flag(self, point: tuple[int, int]):
 		if self.is_opened(point):
 			print(f"warn: tried to flag opened point {point}")
 			return
 
-		self.flagged_points.add(point)
-		self.questioned_points.discard(point)  # cant be flagged and questioned .. almost seems like i should use a different data structure huh.
+		bit = self._bit(point)
+		self.flagged_bits |= bit
+		self.questioned_bits &= ~bit  # cant be flagged and questioned
+		self._dirty_points.add(point)
 
 	def unflag(self, point: tuple[int, int]):
-		self.questioned_points.discard(point)
-		self.flagged_points.discard(point)
+		bit = self._bit(point)
+		self.questioned_bits &= ~bit
+		self.flagged_bits &= ~bit
+		self._dirty_points.add(point)
 
 	def question(self, point: tuple[int, int]):
-		self.questioned_points.add(point)
-		self.flagged_points.discard(point)
+		bit = self._bit(point)
+		self.questioned_bits |= bit
+		self.flagged_bits &= ~bit
+		self._dirty_points.add(point)
 
 	def unquestion(self, point: tuple[int, int]):
-		self.questioned_points.discard(point)
-		self.flagged_points.discard(point)
+		bit = self._bit(point)
+		self.questioned_bits &= ~bit
+		self.flagged_bits &= ~bit
+		self._dirty_points.add(point)
 
 	def is_questioned(self, point: tuple[int, int]) -> bool:
-		return point in self.questioned_points
+		return bool(self.questioned_bits & self._bit(point))
 
 	def is_mine(self, point: tuple[int, int]) -> bool:
-		return point in self.mine_points
+		return bool(self.mine_bits & self._bit(point))
 
 	def is_opened(self, point: tuple[int, int]) -> bool:
-		return self._cell_opened_grid[point[0]][point[1]]
+		return bool(self._opened[point[1] * self._w + point[0]])
 
 	def _set_opened(self, point: tuple[int, int]):
-		self._cell_opened_grid[point[0]][point[1]] = True
+		self._opened[point[1] * self._w + point[0]] = 1
+		self._dirty_points.add(point)
+		self._opened_count += 1
 
 	def in_range(self, point: tuple[int, int]) -> bool:
 		return (0 <= point[0] < self.size[0]) and (0 <= point[1] < self.size[1])
 
 	def proximity_count(self, point: tuple[int, int]) -> int:
-		if self.is_mine(point):
-			return -1
-
-		return sum(
-			(self.is_mine((x, y)) if self.in_range((x, y)) else False)
-			for x in range(point[0]-1, point[0]+2)
-			for y in range(point[1]-1, point[1]+2)
-		)
+		return self._proximity[point[1] * self._w + point[0]]
 
 	def open(self, point: tuple[int, int]):
 		if self.state != GameState.playing:
@@ -169,46 +221,43 @@ class Game:
 			print("clicked a mine, losing!!")
 
 			self.state = GameState.lost
-			# for mine_point in self.mine_points:
+			self._mark_all_dirty()  # every mine and wrong flag gets revealed
+			# for mine_point in self.get_mine_points():
 			# 	self._set_cell(mine_point, CellState.open)
 			return
 
 		# im learning what a flood fill is
 		# https://en.wikipedia.org/wiki/Flood_fill#Stack-based_recursive_implementation_(four-way)
 		# this is actually an 8 way algorithm bc i reach all corners and adjacents.
-		stack = []
-		stack.append(start_point)
-		while len(stack) > 0:
-			point = stack.pop(0)
+		# popping off the end (so depth first) fills the same cells, without list.pop(0) shifting everything over.
+		is_opened = self.is_opened
+		is_mine = self.is_mine
+		is_flagged = self.is_flagged
+		in_range = self.in_range
+		proximity_count = self.proximity_count
+
+		stack = [start_point]
+		while stack:
+			point = stack.pop()
 			# print(f"Visiting {point}")
 
-			if self.is_opened(point):
+			if is_opened(point):
 				continue
 
-			inside = (not self.is_mine(point)) and (not self.is_flagged(point))
+			inside = (not is_mine(point)) and (not is_flagged(point))
 			if inside:
 				# print(f"{n_point} IN")
 				self._set_opened(point)
 
-			if inside and self.proximity_count(point) == 0:
-				new_points = []
-				for x_off in (-1, 0, 1):
-					for y_off in (-1, 0, 1):
-						if x_off == 0 and y_off == 0:
-							continue
-						new_points.append((point[0] + x_off, point[1] + y_off))
-
-				# west = (point[0] - 1, point[1])
-				# east = (point[0] + 1, point[1])
-				# north = (point[0], point[1] - 1)
-				# south = (point[0], point[1] + 1)
-
-				for new_point in new_points:
-					if self.in_range(new_point):
+			if inside and proximity_count(point) == 0:
+				for (x_off, y_off) in _NEIGHBORS:
+					new_point = (point[0] + x_off, point[1] + y_off)
+					if in_range(new_point):
 						stack.append(new_point)
 
-			if self.is_won():
-				self._flag_all_mines()
+		if self.is_won():
+			self._flag_all_mines()
+			self._mark_all_dirty()
 
 
 def test():